@@ -2,21 +2,60 @@
 import os
 import sys
 
-# Redirect stdout to stderr for anything that bypasses our controls
-real_stdout = sys.stdout
-sys.stdout = sys.stderr
+# Redirect stdout to stderr for anything that bypasses our controls. This is done on the
+# file descriptor, and fd 1 stays redirected for the life of the process (see below), so
+# libVLC writing to it can't corrupt the MCP channel even though it is only loaded on first use.
+sys.stdout.flush()
+_real_stdout_fd = os.dup(1)
+os.dup2(2, 1)
 
 # Now safe to import other modules
 import logging
 from mcp.server.fastmcp import FastMCP, Context
-import vlc
 import json
+import re
 from pathlib import Path
 import time
 import threading
-from fuzzywuzzy import fuzz, process
+import asyncio
+import heapq
+import atexit
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import NamedTuple
+from rapidfuzz import fuzz, process, utils
 from mutagen import File as MutagenFile
 
+try:
+    import orjson  # Optional: much faster serializer for large listings
+except ImportError:
+    orjson = None
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags  # Optional: Linux change notifications
+except ImportError:
+    INotify = None
+
+try:
+    from watchdog.observers import Observer  # Optional: change notifications on macOS and Windows
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
+# python-vlc loads libVLC as soon as it is imported, so it is only imported on first use
+# (see _load_vlc); tools and tests that only search the library never pay for it
+vlc = None
+
+def _load_vlc():
+    """Import python-vlc if that hasn't happened yet"""
+    global vlc
+    if vlc is None:
+        import vlc as vlc_module
+        vlc = vlc_module
+    return vlc
+
 # Configure logging to stderr
 logging.basicConfig(
     level=logging.INFO,
@@ -24,10 +63,21 @@ logging.basicConfig(
     stream=sys.stderr
 )
 logger = logging.getLogger("audio-player")
+# Quiet by default so routine requests don't pay for log formatting; set e.g. INFO to trace activity
+_log_level = os.environ.get('AUDIO_PLAYER_LOG_LEVEL', 'WARNING').upper()
+try:
+    logger.setLevel(_log_level)
+except ValueError:
+    logger.setLevel(logging.WARNING)
+    logger.warning(f"Unknown AUDIO_PLAYER_LOG_LEVEL {_log_level!r}, using WARNING")
 
-# Restore stdout for MCP protocol messages only
-sys.stdout = real_stdout
-sys.stdout.reconfigure(line_buffering=True)
+# MCP protocol messages go through sys.stdout, which now writes to the real stdout on its own
+# descriptor. fd 1 is left pointing at stderr rather than being restored: python-vlc is imported
+# lazily (and the player created from a background thread) after this point, and swapping fd 1
+# back and forth around that would race the server writing responses.
+sys.stdout.flush()
+sys.stdout = open(_real_stdout_fd, 'w', buffering=1, encoding=sys.stdout.encoding, errors=sys.stdout.errors,
+                  closefd=False)
 
 # Initialize MCP server
 mcp = FastMCP("audio-player")
@@ -53,74 +103,228 @@ def _get_music_directory():
 AUDIO_DIR = _get_music_directory()
 logger.info(f"Using audio directory: {AUDIO_DIR}")
 
+def _get_supported_formats():
+    """Get the audio file extensions to scan for, optionally overridden by AUDIO_PLAYER_EXTS"""
+    # Note: pygame.mixer natively supports MP3, WAV, OGG
+    # FLAC, OPUS, M4A, AAC support depends on system codecs
+    defaults = frozenset({'.mp3', '.wav', '.ogg', '.flac', '.opus', '.m4a', '.aac'})
+    if 'AUDIO_PLAYER_EXTS' in os.environ:
+        exts = (ext.strip().lower() for ext in os.environ['AUDIO_PLAYER_EXTS'].split(','))
+        formats = frozenset(ext if ext.startswith('.') else f'.{ext}' for ext in exts if ext)
+        if formats:
+            return formats
+        # An empty list would make every scan come back empty, which is never what was meant
+        logger.warning(f"AUDIO_PLAYER_EXTS lists no extensions ({os.environ['AUDIO_PLAYER_EXTS']!r}), using the defaults")
+
+    return defaults
+
 # Supported audio formats
-# Note: pygame.mixer natively supports MP3, WAV, OGG
-# FLAC, OPUS, M4A, AAC support depends on system codecs
-SUPPORTED_FORMATS = {'.mp3', '.wav', '.ogg', '.flac', '.opus', '.m4a', '.aac'}
+SUPPORTED_FORMATS = _get_supported_formats()
+# Tuple form for str.endswith, which checks every suffix in a single C call
+_AUDIO_EXTS = tuple(sorted(SUPPORTED_FORMATS))
+
+# Make sure the directory exists (a no-op if it already does)
+AUDIO_DIR.mkdir(parents=True, exist_ok=True)
 
-# Verify directory exists
-if not AUDIO_DIR.exists():
-    logger.warning(f"Audio directory does not exist: {AUDIO_DIR}")
-    AUDIO_DIR.mkdir(parents=True, exist_ok=True)
-    logger.info(f"Created audio directory: {AUDIO_DIR}")
+# AUDIO_DIR never changes at runtime, so canonicalize it once for the play_audio sandbox check
+_AUDIO_DIR_STR = str(AUDIO_DIR)
+# Ends with a separator so a sibling such as "Music2" doesn't pass as being inside "Music"
+_AUDIO_DIR_RESOLVED = os.path.join(str(AUDIO_DIR.resolve()), '')
 
 # Simple state management
 class AudioState:
+    __slots__ = ('volume', 'playing', 'paused', 'playlist', 'playlist_positions', 'current_index',
+                 'position', 'length_ms', 'vlc_instance', 'media_player', '_position_lock', '_init_lock')
+
     def __init__(self):
         self.volume = 3
         self.playing = None
         self.paused = False
         self.playlist = []
+        self.playlist_positions = {}  # playlist entry -> index
         self.current_index = -1
         self.position = 0.0  # Track position in seconds
+        self.length_ms = 0  # Length of the loaded track, 0 until VLC knows it
         self.vlc_instance = None
         self.media_player = None
         self._position_lock = threading.Lock()
+        self._init_lock = threading.Lock()
+
+    def track_length_ms(self) -> int:
+        """Get the loaded track's length, only asking VLC until it reports one"""
+        if self.length_ms <= 0:
+            self.length_ms = self.media_player.get_length()
+        return self.length_ms
 
     def init_vlc(self):
         """Initialize VLC if not already done"""
-        if self.vlc_instance is None:
-            # More robust VLC initialization for server environments
-            vlc_args = [
-                '--intf', 'dummy',  # No interface
-                '--no-video',       # Audio only
-                '--verbose', '1',   # Some logging for debugging
-                '--aout', 'directsound',  # Windows audio output
-                '--no-metadata-network-access',  # Don't try to fetch metadata
-                '--no-lua',         # Disable lua
-                '--no-stats',       # No statistics
-                '--no-osd',         # No on-screen display
-            ]
+        # media_player is only published once initialization fully succeeded, so this
+        # check needs no lock
+        if self.media_player is not None:
+            return
+        # Serialized so a play request arriving during the startup warm-up waits for it
+        # instead of creating a second instance
+        with self._init_lock:
+            if self.media_player is None:
+                _load_vlc()
+                # More robust VLC initialization for server environments
+                vlc_args = [
+                    '--intf', 'dummy',  # No interface
+                    '--no-video',       # Audio only
+                    '--verbose', '1',   # Some logging for debugging
+                    '--aout', 'directsound',  # Windows audio output
+                    '--no-metadata-network-access',  # Don't try to fetch metadata
+                    '--no-lua',         # Disable lua
+                    '--no-stats',       # No statistics
+                    '--no-osd',         # No on-screen display
+                    '--file-caching', '300',  # Local files need far less than the 1000ms default read-ahead
+                ]
             
-            try:
-                self.vlc_instance = vlc.Instance(vlc_args)
-                self.media_player = self.vlc_instance.media_player_new()
-                self.media_player.audio_set_volume(int(self.volume * 10))  # VLC uses 0-100 scale
-                logger.info("VLC initialized successfully for server environment")
-            except Exception as e:
-                logger.error(f"Failed to initialize VLC: {e}")
-                # Fallback to minimal VLC instance
                 try:
-                    self.vlc_instance = vlc.Instance('--intf', 'dummy')
-                    self.media_player = self.vlc_instance.media_player_new()
-                    self.media_player.audio_set_volume(int(self.volume * 10))
-                    logger.info("VLC initialized with fallback configuration")
-                except Exception as e2:
-                    logger.error(f"VLC fallback initialization also failed: {e2}")
-                    raise e2
+                    instance = vlc.Instance(vlc_args)
+                    media_player = instance.media_player_new()
+                    media_player.audio_set_volume(int(self.volume * 10))  # VLC uses 0-100 scale
+                    self.vlc_instance = instance
+                    self.media_player = media_player
+                    logger.info("VLC initialized successfully for server environment")
+                except Exception as e:
+                    logger.error(f"Failed to initialize VLC: {e}")
+                    # Fallback to minimal VLC instance
+                    try:
+                        instance = vlc.Instance('--intf', 'dummy')
+                        media_player = instance.media_player_new()
+                        media_player.audio_set_volume(int(self.volume * 10))
+                        self.vlc_instance = instance
+                        self.media_player = media_player
+                        logger.info("VLC initialized with fallback configuration")
+                    except Exception as e2:
+                        logger.error(f"VLC fallback initialization also failed: {e2}")
+                        raise e2
 
 state = AudioState()
 
+@lru_cache(maxsize=32)
+def _get_media(path_str: str, mtime_ns: int):
+    """Get a VLC media object for a file, reusing it for recently played tracks
+    
+    mtime_ns is part of the cache key so a file replaced on disk gets a fresh media object.
+    """
+    return state.vlc_instance.media_new(path_str)
+
+def _dumps(obj) -> str:
+    """Serialize to a JSON string, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+# Serialized audio://files payload, reused for as long as _get_audio_files() returns the same list
+_listing_cache = {"files": None, "payload": None}
+
+def _directory_mtimes_changed(dir_mtimes: dict) -> bool:
+    """Check whether any scanned directory was modified (adding/removing entries bumps its mtime)"""
+    for directory, mtime_ns in dir_mtimes.items():
+        try:
+            if os.stat(directory).st_mtime_ns != mtime_ns:
+                return True
+        except OSError:
+            return True
+    return False
+
+class _WatchdogHandler(FileSystemEventHandler):
+    """Marks the watcher dirty when watchdog reports entries being added, removed or renamed"""
+    def __init__(self, watcher):
+        super().__init__()
+        self._watcher = watcher
+
+    def on_any_event(self, event):
+        if event.event_type in ('created', 'deleted', 'moved'):
+            self._watcher.dirty = True
+
+class _LibraryWatcher:
+    """Flags library changes so cached listings can be trusted without stat() calls
+    
+    Uses inotify_simple on Linux and watchdog (FSEvents, ReadDirectoryChangesW) elsewhere,
+    when installed; otherwise callers fall back to comparing directory mtimes.
+    """
+    def __init__(self):
+        if INotify is not None and sys.platform.startswith('linux'):
+            self._backend = "inotify"
+        elif Observer is not None:
+            self._backend = "watchdog"
+        else:
+            self._backend = None
+        self.active = self._backend is not None
+        self.dirty = True
+        self._inotify = None
+        self._observer = None
+        self._watched_roots = []
+        self._lock = threading.Lock()
+
+    def watch(self, directories) -> bool:
+        """Watch the given directories for entries being added, removed or renamed"""
+        if not self.active:
+            return False
+        try:
+            with self._lock:
+                if self._backend == "inotify":
+                    self._watch_inotify(directories)
+                else:
+                    self._watch_observer(directories)
+            return True
+        except OSError as e:
+            # Typically the per-user watch limit; mtime checks still keep listings correct
+            logger.warning(f"Disabling library change notifications: {e}")
+            self.active = False
+            return False
+
+    def _watch_inotify(self, directories):
+        mask = (inotify_flags.CREATE | inotify_flags.DELETE | inotify_flags.MOVED_FROM |
+                inotify_flags.MOVED_TO | inotify_flags.DELETE_SELF | inotify_flags.MOVE_SELF)
+        if self._inotify is None:
+            self._inotify = INotify()
+            threading.Thread(target=self._run, name="library-watcher", daemon=True).start()
+        # Re-adding an existing watch is a no-op, so every rescan can pass all directories
+        for directory in directories:
+            self._inotify.add_watch(directory, mask)
+
+    def _watch_observer(self, directories):
+        if self._observer is None:
+            self._observer = Observer()
+            self._observer.daemon = True
+            self._observer.start()
+        # Recursive watches cover whole subtrees, so only directories reached through a
+        # symlink out of the ones already watched need a watch of their own
+        for directory in directories:
+            real_path = os.path.realpath(directory)
+            if any(real_path == root or real_path.startswith(root.rstrip(os.sep) + os.sep)
+                   for root in self._watched_roots):
+                continue
+            self._observer.schedule(_WatchdogHandler(self), real_path, recursive=True)
+            self._watched_roots.append(real_path)
+
+    def _run(self):
+        while True:
+            self._inotify.read()
+            self.dirty = True
+
+_watcher = _LibraryWatcher()
+
 @mcp.resource("audio://files")
 def audio_files_resource() -> str:
     """List available audio files from all subdirectories"""
     try:
-        files = [
-            {"name": filepath, "display_name": Path(filepath).name, "folder": str(Path(filepath).parent) if Path(filepath).parent != Path('.') else "root"}
-            for filepath in _get_audio_files()
-        ]
-        logger.info(f"Found {len(files)} audio files across all subdirectories")
-        return json.dumps({"files": files})
+        files = _get_audio_files()
+        if files is _listing_cache["files"]:
+            return _listing_cache["payload"]
+        
+        payload = _dumps({"files": [
+            {"name": filepath, "display_name": _get_audio_file(filepath).name, "folder": _get_audio_file(filepath).folder}
+            for filepath in files
+        ]})
+        logger.debug("Found %d audio files across all subdirectories", len(files))
+        _listing_cache["files"] = files
+        _listing_cache["payload"] = payload
+        return payload
     except Exception as e:
         logger.error(f"Error listing audio files: {e}")
         raise
@@ -129,24 +333,24 @@ def audio_files_resource() -> str:
 @mcp.tool()
 async def list_audio_files(ctx: Context) -> dict:
     """List all available audio files in the audio directory"""
-    logger.info("Listing audio files via tool")
+    logger.debug("Listing audio files via tool")
     try:
-        files = _get_audio_files()
+        files = await asyncio.to_thread(_get_audio_files)
         
         # Create detailed file information
         file_details = []
         for filepath in files:
-            path_obj = Path(filepath)
+            audio_file = _get_audio_file(filepath)
             file_details.append({
                 "path": filepath,
-                "name": path_obj.name,
-                "folder": str(path_obj.parent) if path_obj.parent != Path('.') else "root",
-                "extension": path_obj.suffix.lower()
+                "name": audio_file.name,
+                "folder": audio_file.folder,
+                "extension": audio_file.extension
             })
         
         # Log the results
-        logger.info(f"Found {len(files)} audio files across all subdirectories")
-        ctx.info(f"Retrieved {len(files)} audio files from all folders")
+        logger.debug("Found %d audio files across all subdirectories", len(files))
+        await ctx.info(f"Retrieved {len(files)} audio files from all folders")
         
         return {
             "status": "success",
@@ -158,7 +362,7 @@ async def list_audio_files(ctx: Context) -> dict:
     except Exception as e:
         error_msg = f"Error listing audio files: {str(e)}"
         logger.error(error_msg)
-        ctx.error(error_msg)
+        await ctx.error(error_msg)
         raise
 
 @mcp.tool()
@@ -167,16 +371,17 @@ async def list_folders(ctx: Context) -> dict:
     logger.info("Listing audio folders and file counts")
     
     try:
-        files = _get_audio_files()
+        files = await asyncio.to_thread(_get_audio_files)
         
         # Group files by folder
         folder_stats = {}
         for filepath in files:
-            folder = str(Path(filepath).parent) if Path(filepath).parent != Path('.') else "root"
+            audio_file = _get_audio_file(filepath)
+            folder = audio_file.folder
             if folder not in folder_stats:
                 folder_stats[folder] = {"count": 0, "files": []}
             folder_stats[folder]["count"] += 1
-            folder_stats[folder]["files"].append(Path(filepath).name)
+            folder_stats[folder]["files"].append(audio_file.name)
         
         # Create summary
         folder_list = []
@@ -191,7 +396,7 @@ async def list_folders(ctx: Context) -> dict:
         folder_list.sort(key=lambda x: x["folder"])
         
         logger.info(f"Found {len(folder_list)} folders with audio files")
-        ctx.info(f"Found {len(folder_list)} folders containing audio files")
+        await ctx.info(f"Found {len(folder_list)} folders containing audio files")
         
         return {
             "status": "success",
@@ -204,34 +409,30 @@ async def list_folders(ctx: Context) -> dict:
     except Exception as e:
         error_msg = f"Error listing folders: {str(e)}"
         logger.error(error_msg)
-        ctx.error(error_msg)
+        await ctx.error(error_msg)
         raise
 
+# Music terminology normalization, applied in a single pass. Terms that only needed
+# lowercasing (remix, edit, mix, ...) are covered by text.lower().
+_MUSIC_TERM_REPLACEMENTS = {
+    'feat': 'featuring',  # feat -> featuring
+    'ft': 'featuring',    # ft -> featuring
+    'w/': 'with',         # w/ -> with
+    'vs': 'versus',       # vs -> versus
+}
+_MUSIC_TERMS_RE = re.compile(r'\b(?:feat|ft|vs)\b|\bw/\b')
+
+def _replace_music_term(match) -> str:
+    return _MUSIC_TERM_REPLACEMENTS[match.group(0)]
+
 def _normalize_music_terms(text: str) -> str:
     """Normalize common music terminology for better matching"""
-    # Convert to lowercase for processing
     text = text.lower()
-    
-    # Music terminology normalization
-    replacements = {
-        r'\bfeat\b': 'featuring',  # feat -> featuring
-        r'\bft\b': 'featuring',    # ft -> featuring  
-        r'\bw/\b': 'with',         # w/ -> with
-        r'\bvs\b': 'versus',       # vs -> versus
-        r'\bfeaturing\b': 'featuring',  # normalize case
-        r'\bremix\b': 'remix',     # normalize case
-        r'\bedit\b': 'edit',       # normalize case
-        r'\bmix\b': 'mix',         # normalize case
-        r'\boriginal\b': 'original', # normalize case
-        r'\bextended\b': 'extended', # normalize case
-        r'\bofficial\b': 'official', # normalize case
-    }
-    
-    import re
-    for pattern, replacement in replacements.items():
-        text = re.sub(pattern, replacement, text)
-    
-    return text
+    # Most names contain none of the terms; plain substring checks are much cheaper than
+    # running the regex over them
+    if 'feat' not in text and 'ft' not in text and 'vs' not in text and 'w/' not in text:
+        return text
+    return _MUSIC_TERMS_RE.sub(_replace_music_term, text)
 
 def _preprocess_music_query(query: str) -> str:
     """Preprocess search query for better music matching"""
@@ -243,17 +444,30 @@ def _preprocess_music_query(query: str) -> str:
     
     return normalized
 
+# Separators in file names that are treated as spaces for matching
+_FILENAME_SEPARATORS = str.maketrans('_-.', '   ')
+
+def _search_text_priority(i: int, title: str, artist: str) -> tuple[float, str]:
+    """Get the score weight and match type for the i-th search text of a file"""
+    # Priority weights (metadata gets higher priority than filename)
+    if i == 0 and title and artist:  # "Artist - Title"
+        return 1.0, "artist_title"
+    elif i <= 3 and (title or artist):  # Other metadata combinations
+        return 0.9, "metadata"
+    else:  # Filename-based
+        return 0.7, "filename"
+
 def _create_search_data_for_file(file_path: str) -> dict:
     """Create comprehensive search data for a file including metadata and filename"""
     try:
-        # Convert relative path to absolute path for metadata extraction
-        absolute_path = AUDIO_DIR / file_path
+        # Absolute path for metadata extraction
+        absolute_path = _get_audio_file(file_path).absolute_path
         
         # Extract metadata
-        title, artist = _extract_title_and_artist(str(absolute_path))
+        title, artist = _extract_title_and_artist(absolute_path)
         
         # Get filename without extension
-        filename_stem = Path(file_path).stem
+        filename_stem = _get_audio_file(file_path).stem
         
         # Create searchable text combinations
         search_texts = []
@@ -270,7 +484,7 @@ def _create_search_data_for_file(file_path: str) -> dict:
             search_texts.append(artist)
         
         # 2. Filename (cleaned and normalized)
-        clean_filename = filename_stem.replace('_', ' ').replace('-', ' ').replace('.', ' ')
+        clean_filename = filename_stem.translate(_FILENAME_SEPARATORS)
         normalized_filename = _normalize_music_terms(clean_filename)
         search_texts.append(normalized_filename)
         search_texts.append(clean_filename)
@@ -278,27 +492,66 @@ def _create_search_data_for_file(file_path: str) -> dict:
         # 3. Raw filename stem
         search_texts.append(filename_stem)
         
+        priorities = [_search_text_priority(i, title, artist) for i in range(len(search_texts))]
+        
         return {
             "file_path": file_path,
             "title": title,
             "artist": artist,
             "filename": filename_stem,
-            "search_texts": search_texts
+            "search_texts": search_texts,
+            # Lowercased once here for the exact/phrase checks, instead of on every search
+            "search_texts_lower": [search_text.lower() for search_text in search_texts],
+            "weights": [weight for weight, _ in priorities],
+            "match_types": [match_type for _, match_type in priorities]
         }
         
     except Exception as e:
         logger.debug(f"Error creating search data for {file_path}: {e}")
         # Fallback to filename only
-        filename_stem = Path(file_path).stem
-        clean_filename = filename_stem.replace('_', ' ').replace('-', ' ').replace('.', ' ')
+        filename_stem = _get_audio_file(file_path).stem
+        clean_filename = filename_stem.translate(_FILENAME_SEPARATORS)
         return {
             "file_path": file_path,
             "title": "",
             "artist": "",
             "filename": filename_stem,
-            "search_texts": [clean_filename, filename_stem]
+            "search_texts": [clean_filename, filename_stem],
+            "search_texts_lower": [clean_filename.lower(), filename_stem.lower()],
+            "weights": [0.7, 0.7],
+            "match_types": ["filename", "filename"]
         }
 
+# Search data for the most recently searched file list, see _get_search_data()
+# (files, data, texts) for the last file list searched; replaced as a whole so readers never
+# see data and texts from two different builds
+_search_index = (None, None, None)
+_search_index_lock = threading.Lock()
+
+def _get_search_data(files: list) -> tuple[list, list]:
+    """Get search data for every file, reusing it while the same file list is searched
+    
+    Returns the per-file search data and all of their search texts flattened into one list
+    in the same order, for scoring in a single batch.
+    
+    _get_audio_files() returns the same list object until the library is rescanned, so
+    repeated searches only score the cached search texts instead of rebuilding them.
+    """
+    global _search_index
+    indexed_files, data, texts = _search_index
+    if files is indexed_files:
+        return data, texts
+    # Concurrent searches on a cold index wait for a single build instead of each doing their own
+    with _search_index_lock:
+        indexed_files, data, texts = _search_index
+        if files is indexed_files:
+            return data, texts
+        _prefetch_file_metadata([_get_audio_file(file_path).absolute_path for file_path in files])
+        data = [_create_search_data_for_file(file_path) for file_path in files]
+        texts = [search_text for file_data in data for search_text in file_data["search_texts"]]
+        _search_index = (files, data, texts)
+    return data, texts
+
 def _enhanced_metadata_search(files: list, query: str, limit: int = 10) -> list:
     """Enhanced search that considers title, artist metadata and filename"""
     if not query.strip():
@@ -306,16 +559,23 @@ def _enhanced_metadata_search(files: list, query: str, limit: int = 10) -> list:
     
     logger.info(f"Performing enhanced metadata search for: '{query}'")
     
-    # Create search data for all files
-    search_data = []
-    for file_path in files:
-        search_data.append(_create_search_data_for_file(file_path))
+    search_data, search_texts = _get_search_data(files)
     
     query_lower = query.lower().strip()
     normalized_query = _preprocess_music_query(query)
     
+    # Fuzzy-score every search text in one RapidFuzz call instead of one call per text.
+    # Texts under 30 can't reach the threshold at any weight and are left at 0.
+    fuzzy_scores = [0] * len(search_texts)
+    for _, fuzzy_score, index in process.extract_iter(normalized_query, search_texts,
+                                                      scorer=fuzz.token_sort_ratio,
+                                                      processor=utils.default_process,
+                                                      score_cutoff=30):
+        fuzzy_scores[index] = fuzzy_score
+    
     # Score matches with different priorities
     scored_matches = []
+    offset = 0
     
     for data in search_data:
         max_score = 0
@@ -324,18 +584,10 @@ def _enhanced_metadata_search(files: list, query: str, limit: int = 10) -> list:
         
         # Check each search text for this file
         for i, search_text in enumerate(data["search_texts"]):
-            search_text_lower = search_text.lower()
+            search_text_lower = data["search_texts_lower"][i]
             
-            # Priority weights (metadata gets higher priority than filename)
-            if i == 0 and data["title"] and data["artist"]:  # "Artist - Title"
-                weight = 1.0
-                match_type = "artist_title"
-            elif i <= 3 and (data["title"] or data["artist"]):  # Other metadata combinations
-                weight = 0.9
-                match_type = "metadata"
-            else:  # Filename-based
-                weight = 0.7
-                match_type = "filename"
+            weight = data["weights"][i]
+            match_type = data["match_types"][i]
             
             # Exact match (highest priority)
             if query_lower == search_text_lower:
@@ -345,9 +597,8 @@ def _enhanced_metadata_search(files: list, query: str, limit: int = 10) -> list:
                 score = 95 * weight
             # Fuzzy match
             else:
-                # Use token sort ratio for better matching of reordered words
-                fuzzy_score = fuzz.token_sort_ratio(normalized_query, search_text)
-                score = fuzzy_score * weight
+                # Token sort ratio (scored above) for better matching of reordered words
+                score = fuzzy_scores[offset + i] * weight
             
             if score > max_score:
                 max_score = score
@@ -356,6 +607,7 @@ def _enhanced_metadata_search(files: list, query: str, limit: int = 10) -> list:
                     match_type = match_type
                 else:
                     match_type = f"{match_type}_fuzzy"
+        offset += len(data["search_texts"])
         
         if max_score >= 30:  # Minimum threshold
             scored_matches.append({
@@ -368,9 +620,8 @@ def _enhanced_metadata_search(files: list, query: str, limit: int = 10) -> list:
                 "filename": data["filename"]
             })
     
-    # Sort by score (descending) and return top matches
-    scored_matches.sort(key=lambda x: x["score"], reverse=True)
-    return scored_matches[:limit]
+    # Return top matches by score (descending); nlargest keeps ties in order like a stable sort
+    return heapq.nlargest(limit, scored_matches, key=lambda x: x["score"])
 
 def _enhanced_music_search(candidates: list, query: str, limit: int = 10) -> list:
     """Enhanced search specifically designed for music files"""
@@ -385,254 +636,310 @@ def _enhanced_music_search(candidates: list, query: str, limit: int = 10) -> lis
     
     # If query is a music term, prioritize exact matches
     if query_lower in music_terms or any(term in query_lower for term in music_terms):
+        word_boundary_re = re.compile(rf'\b{re.escape(query_lower)}\b')
         for i, candidate in enumerate(candidates):
             candidate_lower = candidate.lower()
             # Exact word boundary match gets highest priority
             if query_lower in candidate_lower:
                 # Check if it's a word boundary match
-                import re
-                if re.search(rf'\b{re.escape(query_lower)}\b', candidate_lower):
+                if word_boundary_re.search(candidate_lower):
                     exact_matches.append((candidate, 95, i))
                 else:
                     partial_matches.append((candidate, 85, i))
     
     # Regular fuzzy matching for remaining candidates
-    remaining_candidates = [c for i, c in enumerate(candidates) 
-                          if i not in [match[2] for match in exact_matches + partial_matches]]
+    matched_indices = {match[2] for match in exact_matches}
+    matched_indices.update(match[2] for match in partial_matches)
+    remaining_indices = [i for i in range(len(candidates)) if i not in matched_indices]
+    remaining_candidates = [candidates[i] for i in remaining_indices]
     
     if remaining_candidates:
-        fuzzy_matches = process.extract(normalized_query, remaining_candidates, 
-                                      scorer=fuzz.token_sort_ratio, limit=limit)
-        fuzzy_results = [(match, score, candidates.index(match)) for match, score in fuzzy_matches]
+        fuzzy_matches = process.extract(normalized_query, remaining_candidates,
+                                        scorer=fuzz.token_sort_ratio, limit=limit,
+                                        processor=utils.default_process, score_cutoff=30)
+        # extract() reports positions in remaining_candidates; map them back to candidates
+        fuzzy_results = [(match, score, remaining_indices[index]) for match, score, index in fuzzy_matches]
     else:
         fuzzy_results = []
     
-    # Combine all matches and sort by score
+    # Combine all matches and keep the best by score
     all_matches = exact_matches + partial_matches + fuzzy_results
-    all_matches.sort(key=lambda x: x[1], reverse=True)
+    return heapq.nlargest(limit, all_matches, key=lambda x: x[1])
+
+def _get_cache_directory():
+    """Get the directory for files cached between runs"""
+    return Path(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')) / 'audio_player_mcp'
+
+_METADATA_CACHE_FILE = _get_cache_directory() / 'meta.json'
+
+# Tags per file as (st_mtime_ns, st_size, title, artist, genre). An entry is only used while
+# the file's mtime and size still match, so edited or replaced files are read again.
+_METADATA_CACHE: dict[str, tuple[int, int, str, str, str]] = {}
+_metadata_cache_lock = threading.Lock()
+_metadata_cache_state = {"loaded": False, "save_timer": None}
+
+def _load_metadata_cache():
+    """Load the metadata cache written by a previous run"""
+    try:
+        with open(_METADATA_CACHE_FILE, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+        for file_path, entry in entries.items():
+            if isinstance(entry, list) and len(entry) == 5:
+                _METADATA_CACHE[file_path] = tuple(entry)
+        logger.debug("Loaded %d cached metadata entries", len(_METADATA_CACHE))
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable metadata cache {_METADATA_CACHE_FILE}: {e}")
+
+def _save_metadata_cache():
+    """Write the metadata cache to disk"""
+    with _metadata_cache_lock:
+        _metadata_cache_state["save_timer"] = None
+        if _files_cache["files"] is not None:
+            # Drop files that were deleted, renamed or belong to another AUDIO_DIR, so the
+            # cache only ever holds the current library instead of growing with every run
+            library_paths = {audio_file.absolute_path for audio_file in _files_cache["info"].values()}
+            for file_path in [path for path in list(_METADATA_CACHE) if path not in library_paths]:
+                _METADATA_CACHE.pop(file_path, None)
+        entries = dict(_METADATA_CACHE)
+    tmp_file = None
+    try:
+        _METADATA_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        # A temp file of its own, so servers or test runs saving at the same time can't
+        # interleave their writes; the last complete cache written wins
+        fd, tmp_file = tempfile.mkstemp(dir=_METADATA_CACHE_FILE.parent, prefix='meta.', suffix='.tmp')
+        with open(fd, 'w', encoding='utf-8') as f:
+            f.write(_dumps(entries))
+        # Atomic, so a run that is killed mid-write never leaves a truncated cache behind
+        os.replace(tmp_file, _METADATA_CACHE_FILE)
+    except OSError as e:
+        logger.warning(f"Could not write metadata cache {_METADATA_CACHE_FILE}: {e}")
+        if tmp_file is not None:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+
+def _schedule_metadata_save():
+    """Save the cache shortly after it changes, so a full library scan is written once"""
+    with _metadata_cache_lock:
+        if _metadata_cache_state["save_timer"] is None:
+            timer = threading.Timer(2.0, _save_metadata_cache)
+            timer.daemon = True
+            timer.start()
+            _metadata_cache_state["save_timer"] = timer
+
+@atexit.register
+def _flush_metadata_cache():
+    """Save pending cache changes on exit instead of losing them with the daemon timer"""
+    timer = _metadata_cache_state["save_timer"]
+    if timer is not None:
+        timer.cancel()
+        _save_metadata_cache()
+
+def _get_cached_metadata(file_path: str, file_stat: os.stat_result) -> tuple[str, str, str] | None:
+    """Get (title, artist, genre) from the cache if the entry still matches the file"""
+    if not _metadata_cache_state["loaded"]:
+        with _metadata_cache_lock:
+            if not _metadata_cache_state["loaded"]:
+                _load_metadata_cache()
+                _metadata_cache_state["loaded"] = True
+    
+    entry = _METADATA_CACHE.get(file_path)
+    if entry is not None and entry[0] == file_stat.st_mtime_ns and entry[1] == file_stat.st_size:
+        return entry[2], entry[3], entry[4]
+    return None
+
+# Shared by every tag prefetch; worker threads are only started once there is work for them
+_metadata_executor = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4),
+                                        thread_name_prefix="metadata")
+
+def _prefetch_file_metadata(file_paths: list):
+    """Read tags for all files missing from the metadata cache on a thread pool
+    
+    Mutagen mostly waits on file reads, which release the GIL, so a cold library loads
+    much faster in parallel. Cached files are skipped since the pool only adds overhead there.
+    """
+    missing = []
+    for file_path in file_paths:
+        try:
+            if _get_cached_metadata(file_path, os.stat(file_path)) is None:
+                missing.append(file_path)
+        except OSError:
+            continue
+    if len(missing) < 2:
+        return
     
-    return all_matches[:limit]
+    logger.debug("Reading tags for %d uncached files", len(missing))
+    for _ in _metadata_executor.map(_get_file_metadata, missing):
+        pass
+
+def _get_file_metadata(file_path: str) -> tuple[str, str, str]:
+    """Get (title, artist, genre) for a file, only reading its tags if it changed since last time"""
+    try:
+        file_stat = os.stat(file_path)
+    except OSError:
+        return "", "", "Unknown"
+    
+    cached = _get_cached_metadata(file_path, file_stat)
+    if cached is not None:
+        return cached
+    
+    title, artist, genre = _read_tags(file_path)
+    _METADATA_CACHE[file_path] = (file_stat.st_mtime_ns, file_stat.st_size, title, artist, genre)
+    _schedule_metadata_save()
+    return title, artist, genre
 
 def _extract_title_and_artist(file_path: str) -> tuple[str, str]:
     """Extract title and artist information from audio file metadata"""
-    try:
-        audio_file = MutagenFile(file_path)
-        if audio_file is None:
-            return "", ""
-        
-        title = ""
-        artist = ""
-        
-        # Try different approaches based on file type
-        if hasattr(audio_file, 'tags') and audio_file.tags:
-            tags = audio_file.tags
-            
-            # For MP3 files with ID3 tags
-            if hasattr(tags, 'get'):
-                # Try various ID3 title tag formats
-                for title_key in ['TIT2', 'TITLE', 'Title']:
-                    if title_key in tags:
-                        title_value = tags[title_key]
-                        if hasattr(title_value, 'text') and title_value.text:
-                            title = str(title_value.text[0])
-                            break
-                        elif isinstance(title_value, list) and len(title_value) > 0:
-                            title = str(title_value[0])
-                            break
-                
-                # Try various ID3 artist tag formats
-                for artist_key in ['TPE1', 'ARTIST', 'Artist']:
-                    if artist_key in tags:
-                        artist_value = tags[artist_key]
-                        if hasattr(artist_value, 'text') and artist_value.text:
-                            artist = str(artist_value.text[0])
-                            break
-                        elif isinstance(artist_value, list) and len(artist_value) > 0:
-                            artist = str(artist_value[0])
-                            break
-        
-        # For FLAC, OGG, and other formats - try common field names
-        if not title and hasattr(audio_file, 'get'):
-            for title_key in ['TITLE', 'title', 'Title']:
-                if title_key in audio_file:
-                    title_value = audio_file[title_key]
-                    if isinstance(title_value, list) and len(title_value) > 0:
-                        title = str(title_value[0])
-                        break
-                    elif isinstance(title_value, str):
-                        title = title_value
-                        break
-        
-        if not artist and hasattr(audio_file, 'get'):
-            for artist_key in ['ARTIST', 'artist', 'Artist']:
-                if artist_key in audio_file:
-                    artist_value = audio_file[artist_key]
-                    if isinstance(artist_value, list) and len(artist_value) > 0:
-                        artist = str(artist_value[0])
-                        break
-                    elif isinstance(artist_value, str):
-                        artist = artist_value
-                        break
-        
-        # Alternative approach: direct dictionary access
-        if not title:
-            for title_key in ['TITLE', 'title', 'Title', 'TIT2']:
-                try:
-                    if title_key in audio_file:
-                        title_value = audio_file[title_key]
-                        if isinstance(title_value, list) and len(title_value) > 0:
-                            title = str(title_value[0])
-                            break
-                        elif isinstance(title_value, str):
-                            title = title_value
-                            break
-                except Exception:
-                    continue
-        
-        if not artist:
-            for artist_key in ['ARTIST', 'artist', 'Artist', 'TPE1']:
-                try:
-                    if artist_key in audio_file:
-                        artist_value = audio_file[artist_key]
-                        if isinstance(artist_value, list) and len(artist_value) > 0:
-                            artist = str(artist_value[0])
-                            break
-                        elif isinstance(artist_value, str):
-                            artist = artist_value
-                            break
-                except Exception:
-                    continue
-        
-        # Clean up the strings
-        if title:
-            title = title.strip()
-        if artist:
-            artist = artist.strip()
-        
-        return title, artist
-        
-    except Exception as e:
-        logger.debug(f"Could not extract title/artist from {file_path}: {e}")
-        return "", ""
+    title, artist, _ = _get_file_metadata(file_path)
+    return title, artist
 
 def _extract_genre_from_file(file_path: str) -> str:
     """Extract genre information from audio file metadata"""
+    return _get_file_metadata(file_path)[2]
+
+# Tag keys to try, in order: ID3 frames first, then the field names used by FLAC, OGG and others
+_TITLE_KEYS = ('TIT2', 'TITLE', 'Title', 'title')
+_ARTIST_KEYS = ('TPE1', 'ARTIST', 'Artist', 'artist')
+_GENRE_KEYS = ('TCON', 'TCO', 'TIT1', 'GENRE', 'Genre', 'genre')  # TCON is standard, TCO is old format
+
+def _first_tag(audio_file, keys) -> str:
+    """Get the first non-empty value among the given tag keys, or "" if there is none"""
+    tags = audio_file.tags
+    if not tags:
+        return ""
+    for key in keys:
+        try:
+            value = tags[key]
+        except Exception:
+            continue
+        # ID3 frames keep their values in .text, other formats use lists or plain strings
+        if hasattr(value, 'text'):
+            if value.text:
+                return str(value.text[0])
+        elif isinstance(value, list):
+            if value:
+                return str(value[0])
+        elif isinstance(value, str):
+            return value
+    return ""
+
+def _clean_genre(genre: str) -> str:
+    """Normalize a raw genre tag value for display and grouping"""
+    if genre:
+        genre = genre.strip()
+        # Remove ID3v1 genre numbers (e.g., "(13)" or "(13)Pop")
+        genre = re.sub(r'^\(\d+\)', '', genre).strip()
+        if genre.startswith('(') and genre.endswith(')'):
+            genre = genre[1:-1]
+        # Capitalize properly
+        if genre:
+            return genre.title()
+    return "Unknown"
+
+def _read_tags(file_path: str) -> tuple[str, str, str]:
+    """Read title, artist and genre tags from an audio file in a single Mutagen pass"""
     try:
         audio_file = MutagenFile(file_path)
         if audio_file is None:
-            return "Unknown"
-        
-        # Debug: Let's see what tags are available
-        # logger.debug(f"Available tags for {file_path}: {list(audio_file.keys())}")
+            return "", "", "Unknown"
         
-        genre = None
-        
-        # Try different approaches based on file type
-        if hasattr(audio_file, 'tags') and audio_file.tags:
-            tags = audio_file.tags
-            
-            # For MP3 files with ID3 tags
-            if hasattr(tags, 'get'):
-                # Try various ID3 genre tag formats
-                for genre_key in ['TCON', 'TCO', 'TIT1']:  # TCON is standard, TCO is old format
-                    if genre_key in tags:
-                        genre_value = tags[genre_key]
-                        if hasattr(genre_value, 'text') and genre_value.text:
-                            genre = str(genre_value.text[0])
-                            break
-                        elif isinstance(genre_value, list) and len(genre_value) > 0:
-                            genre = str(genre_value[0])
-                            break
-        
-        # For FLAC, OGG, and other formats - try common genre field names
-        if not genre and hasattr(audio_file, 'get'):
-            for genre_key in ['GENRE', 'genre', 'Genre']:
-                if genre_key in audio_file:
-                    genre_value = audio_file[genre_key]
-                    if isinstance(genre_value, list) and len(genre_value) > 0:
-                        genre = str(genre_value[0])
-                        break
-                    elif isinstance(genre_value, str):
-                        genre = genre_value
-                        break
-        
-        # Alternative approach: direct dictionary access
-        if not genre:
-            # Try direct access to the audio file as dict
-            for genre_key in ['GENRE', 'genre', 'Genre', 'TCON']:
-                try:
-                    if genre_key in audio_file:
-                        genre_value = audio_file[genre_key]
-                        if isinstance(genre_value, list) and len(genre_value) > 0:
-                            genre = str(genre_value[0])
-                            break
-                        elif isinstance(genre_value, str):
-                            genre = genre_value
-                            break
-                except Exception:
-                    continue
-        
-        # Clean up the genre string
-        if genre:
-            genre = genre.strip()
-            # Remove ID3v1 genre numbers (e.g., "(13)" or "(13)Pop")
-            import re
-            genre = re.sub(r'^\(\d+\)', '', genre).strip()
-            if genre.startswith('(') and genre.endswith(')'):
-                genre = genre[1:-1]
-            # Capitalize properly
-            if genre:
-                genre = genre.title()
-                return genre if genre else "Unknown"
-        
-        return "Unknown"
+        title = _first_tag(audio_file, _TITLE_KEYS).strip()
+        artist = _first_tag(audio_file, _ARTIST_KEYS).strip()
+        genre = _clean_genre(_first_tag(audio_file, _GENRE_KEYS))
+        return title, artist, genre
         
     except Exception as e:
-        logger.debug(f"Could not extract genre from {file_path}: {e}")
-        return "Unknown"
+        logger.debug(f"Could not extract tags from {file_path}: {e}")
+        return "", "", "Unknown"
 
-def _get_all_genres() -> dict:
-    """Get all unique genres from the music collection with file counts"""
+# (files, genres) for the last scan, where genres maps genre -> [(position in the file list,
+# path, genre), ...] in library order; replaced as a whole, see _get_genre_index()
+_genre_index = (None, None)
+_genre_index_lock = threading.Lock()
+
+def _get_genre_index() -> dict:
+    """Get the files of each genre, rebuilding the index only when the library was rescanned"""
+    global _genre_index
     files = _get_audio_files()
-    genre_counts = {}
-    
-    logger.info(f"Extracting genres from {len(files)} files...")
+    indexed_files, genres = _genre_index
+    if files is indexed_files:
+        return genres
     
-    for file_path in files:
-        # Convert relative path to absolute path
-        absolute_path = AUDIO_DIR / file_path
-        genre = _extract_genre_from_file(str(absolute_path))
-        if genre in genre_counts:
-            genre_counts[genre] += 1
-        else:
-            genre_counts[genre] = 1
-    
-    return genre_counts
+    # Concurrent genre queries on a cold index wait for a single build
+    with _genre_index_lock:
+        indexed_files, genres = _genre_index
+        if files is indexed_files:
+            return genres
+        
+        logger.info(f"Extracting genres from {len(files)} files...")
+        
+        absolute_paths = [_get_audio_file(file_path).absolute_path for file_path in files]
+        _prefetch_file_metadata(absolute_paths)
+        
+        genres = {}
+        for position, (file_path, absolute_path) in enumerate(zip(files, absolute_paths)):
+            genre = _extract_genre_from_file(absolute_path)
+            genres.setdefault(genre, []).append((position, file_path, genre))
+        _genre_index = (files, genres)
+    return genres
+
+def _get_all_genres() -> dict:
+    """Get all unique genres from the music collection with file counts"""
+    return {genre: len(entries) for genre, entries in _get_genre_index().items()}
 
 def _search_by_genre(genre_query: str, limit: int = 20) -> list:
     """Search for songs by genre"""
-    files = _get_audio_files()
-    matching_files = []
-    
     genre_query_lower = genre_query.lower().strip()
+    matching_genres = [entries for genre, entries in _get_genre_index().items()
+                       if genre_query_lower in genre.lower()]
+    matching_files = []
     
-    for file_path in files:
-        # Convert relative path to absolute path
-        absolute_path = AUDIO_DIR / file_path
-        file_genre = _extract_genre_from_file(str(absolute_path))
-        if file_genre.lower() == genre_query_lower or genre_query_lower in file_genre.lower():
-            matching_files.append({
-                "file": file_path,
-                "name": Path(file_path).name,
-                "folder": str(Path(file_path).parent) if Path(file_path).parent != Path('.') else "root",
-                "genre": file_genre
-            })
-            
-            if len(matching_files) >= limit:
-                break
+    # Merge the matching genres back into library order, the order a full scan would find them in
+    for _, file_path, file_genre in heapq.merge(*matching_genres):
+        audio_file = _get_audio_file(file_path)
+        matching_files.append({
+            "file": file_path,
+            "name": audio_file.name,
+            "folder": audio_file.folder,
+            "genre": file_genre
+        })
+        
+        if len(matching_files) >= limit:
+            break
     
     return matching_files
 
+def _pick_random_by_genre(genre_query: str) -> tuple[dict | None, int]:
+    """Pick a song uniformly at random from every song whose genre matches, and count them
+    
+    Indexes straight into the genre index instead of building the match list first.
+    """
+    import random
+    
+    genre_query_lower = genre_query.lower().strip()
+    matching_genres = [entries for genre, entries in _get_genre_index().items()
+                       if genre_query_lower in genre.lower()]
+    total = sum(len(entries) for entries in matching_genres)
+    if not total:
+        return None, 0
+    
+    pick = random.randrange(total)
+    for entries in matching_genres:
+        if pick < len(entries):
+            break
+        pick -= len(entries)
+    _, file_path, file_genre = entries[pick]
+    audio_file = _get_audio_file(file_path)
+    return {
+        "file": file_path,
+        "name": audio_file.name,
+        "folder": audio_file.folder,
+        "genre": file_genre
+    }, total
+
 @mcp.tool()
 async def search_songs(query: str, ctx: Context, limit: int = 10) -> dict:
     """Search for songs using fuzzy matching"""
@@ -640,7 +947,7 @@ async def search_songs(query: str, ctx: Context, limit: int = 10) -> dict:
     
     try:
         # Get all available audio files
-        files = _get_audio_files()
+        files = await asyncio.to_thread(_get_audio_files)
         
         if not files:
             return {
@@ -655,21 +962,22 @@ async def search_songs(query: str, ctx: Context, limit: int = 10) -> dict:
             matches = [
                 {
                     "file": f, 
-                    "name": Path(f).name,
-                    "folder": str(Path(f).parent) if Path(f).parent != Path('.') else "root",
+                    "name": _get_audio_file(f).name,
+                    "folder": _get_audio_file(f).folder,
                     "score": 100, 
                     "match_type": "all"
                 } for f in files[:limit]
             ]
         else:
             # Use enhanced metadata search that considers title, artist and filename
-            search_results = _enhanced_metadata_search(files, query, limit)
+            search_results = await asyncio.to_thread(_enhanced_metadata_search, files, query, limit)
             
             # Convert results to our format
             matches = []
             for result in search_results:
                 # Create display info with metadata when available
-                display_name = Path(result["file_path"]).name
+                audio_file = _get_audio_file(result["file_path"])
+                display_name = audio_file.name
                 if result["title"] and result["artist"]:
                     display_info = f"{result['artist']} - {result['title']}"
                 elif result["title"]:
@@ -682,7 +990,7 @@ async def search_songs(query: str, ctx: Context, limit: int = 10) -> dict:
                 matches.append({
                     "file": result["file_path"],
                     "name": display_name,
-                    "folder": str(Path(result["file_path"]).parent) if Path(result["file_path"]).parent != Path('.') else "root",
+                    "folder": audio_file.folder,
                     "score": round(result["score"], 1),
                     "match_type": result["match_type"],
                     "matched_text": result["match_text"],
@@ -692,7 +1000,7 @@ async def search_songs(query: str, ctx: Context, limit: int = 10) -> dict:
                 })
         
         logger.info(f"Found {len(matches)} matches for query '{query}'")
-        ctx.info(f"Found {len(matches)} matching songs")
+        await ctx.info(f"Found {len(matches)} matching songs")
         
         return {
             "status": "success",
@@ -704,7 +1012,7 @@ async def search_songs(query: str, ctx: Context, limit: int = 10) -> dict:
     except Exception as e:
         error_msg = f"Error searching songs: {str(e)}"
         logger.error(error_msg)
-        ctx.error(error_msg)
+        await ctx.error(error_msg)
         raise
 
 @mcp.tool()
@@ -744,54 +1052,66 @@ async def search_and_play(query: str, ctx: Context) -> dict:
     except Exception as e:
         error_msg = f"Error in search and play: {str(e)}"
         logger.error(error_msg)
-        ctx.error(error_msg)
+        await ctx.error(error_msg)
         raise
 
 @mcp.tool()
 async def play_audio(filename: str, ctx: Context) -> dict:
     """Play an audio file"""
-    logger.info(f"Attempting to play: {filename}")
+    logger.debug("Attempting to play: %s", filename)
     
     # Handle both relative paths (from subdirectories) and just filenames
-    if "/" in filename or "\\" in filename or Path(filename).is_absolute():
+    if "/" in filename or "\\" in filename or os.path.isabs(filename):
         # This looks like a path (relative or absolute)
-        file_path = AUDIO_DIR / filename
+        file_path = os.path.join(_AUDIO_DIR_STR, filename)
     else:
         # This is just a filename, try to find it in the directory tree
-        all_files = _get_audio_files()
-        matching_files = [f for f in all_files if Path(f).name == filename]
+        all_files = await asyncio.to_thread(_get_audio_files)
+        matching_files = [f for f in all_files if _get_audio_file(f).name == filename]
+        if not matching_files:
+            # It may have been added since the library was last checked
+            _expire_audio_files()
+            all_files = await asyncio.to_thread(_get_audio_files)
+            matching_files = [f for f in all_files if _get_audio_file(f).name == filename]
         
         if not matching_files:
             raise FileNotFoundError(f"Audio file not found: {filename}")
         elif len(matching_files) > 1:
             # Multiple files with same name, use the first one but warn
             logger.warning(f"Multiple files named '{filename}' found, using: {matching_files[0]}")
-            ctx.info(f"Multiple files found, playing: {matching_files[0]}")
+            await ctx.info(f"Multiple files found, playing: {matching_files[0]}")
         
-        file_path = AUDIO_DIR / matching_files[0]
+        file_path = os.path.join(_AUDIO_DIR_STR, matching_files[0])
     
     try:
-        # Validate file exists and is within audio directory
-        if not file_path.exists():
+        # Validate file exists and is within audio directory; the stat result is reused
+        # for the media cache key
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            # Possibly removed since the last check; don't keep listing it for the rest of the TTL
+            _expire_audio_files()
             raise FileNotFoundError(f"Audio file not found: {filename}")
-        if not str(file_path.resolve()).startswith(str(AUDIO_DIR.resolve())):
+        if not os.path.realpath(file_path).startswith(_AUDIO_DIR_RESOLVED):
             raise ValueError("File must be in the audio directory")
         
-        # Initialize VLC if needed
-        state.init_vlc()
+        # Initialize VLC if needed (libVLC startup blocks, keep it off the event loop)
+        if state.media_player is None:
+            # Normally already done by the startup warm-up
+            await asyncio.to_thread(state.init_vlc)
         logger.info("VLC audio system ready")
-        ctx.info("VLC audio system ready")
         
-        # Stop any current playback
-        if state.playing and state.media_player.is_playing():
-            state.media_player.stop()
-            ctx.info("Stopped previous playback")
+        # Stop any current playback (stop() waits for VLC's decoder threads to wind down).
+        # Ask the player rather than trusting state.playing, which goes stale when a track ends.
+        if state.media_player.is_playing():
+            await asyncio.to_thread(state.media_player.stop)
+            logger.info("Stopped previous playback")
         
         # Load and play
-        ctx.info(f"Loading audio file: {filename}")
         try:
-            media = state.vlc_instance.media_new(str(file_path))
-            state.media_player.set_media(media)
+            media = _get_media(file_path, file_stat.st_mtime_ns)
+            await asyncio.to_thread(state.media_player.set_media, media)
+            state.length_ms = 0  # Looked up again once VLC has parsed the new track
             logger.info(f"Media loaded successfully: {file_path}")
         except Exception as e:
             raise Exception(f"Failed to load audio file: {e}")
@@ -801,15 +1121,20 @@ async def play_audio(filename: str, ctx: Context) -> dict:
         logger.info(f"Volume set to {int(state.volume * 10)}/100")
         
         # Start playback
-        play_result = state.media_player.play()
+        play_result = await asyncio.to_thread(state.media_player.play)
         logger.info(f"VLC play() returned: {play_result}")
         
-        # Wait a moment for playback to start and verify
-        time.sleep(0.5)
+        # Give playback up to half a second to start, polling without blocking the event loop
+        # so the usual case returns as soon as VLC reports it
+        for _ in range(10):
+            await asyncio.sleep(0.05)
+            # libvlc's is_playing() is just get_state() == Playing, so one call gives both
+            player_state = state.media_player.get_state()
+            is_playing = player_state == vlc.State.Playing
+            if is_playing or player_state == vlc.State.Error:
+                break
         
         # Check if playback actually started
-        is_playing = state.media_player.is_playing()
-        player_state = state.media_player.get_state()
         logger.info(f"Is playing: {is_playing}, Player state: {player_state}")
         
         if not is_playing and player_state not in [vlc.State.Playing, vlc.State.Opening]:
@@ -821,10 +1146,10 @@ async def play_audio(filename: str, ctx: Context) -> dict:
         # Update state
         state.playing = filename
         state.paused = False
-        _update_playlist()  # Update playlist and current index
+        await _refresh_playlist()  # Update playlist and current index
         
         logger.info(f"Playing {filename} at volume {state.volume}/10")
-        ctx.info(f"Started playback: {filename}")
+        await ctx.info(f"Started playback: {filename}")
         
         return {
             "status": "playing",
@@ -837,12 +1162,12 @@ async def play_audio(filename: str, ctx: Context) -> dict:
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Playback error: {error_msg}")
-        ctx.error(error_msg)
+        await ctx.error(error_msg)
         raise
 
 @mcp.tool()
-def stop_playback(ctx: Context) -> dict:
-    """Stop playback"""
+async def stop_playback(ctx: Context, reset: bool = False) -> dict:
+    """Stop playback (reset=True also drops cached media for recently played files)"""
     try:
         if state.media_player is None:
             msg = "Audio system not initialized"
@@ -850,22 +1175,24 @@ def stop_playback(ctx: Context) -> dict:
             return {"status": "not_initialized", "message": msg}
         
         try:
-            state.media_player.stop()
+            await asyncio.to_thread(state.media_player.stop)
         except Exception as e:
             raise Exception(f"Failed to stop playback: {e}")
         
         state.playing = None
         state.paused = False
+        state.length_ms = 0
         
-        msg = "Playback stopped"
-        logger.info(msg)
-        ctx.info(msg)
+        if reset:
+            _get_media.cache_clear()
+        
+        logger.info("Playback stopped")
         return {"status": "stopped"}
         
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Stop error: {error_msg}")
-        ctx.error(error_msg)
+        await ctx.error(error_msg)
         raise
 
 @mcp.tool()
@@ -892,13 +1219,13 @@ async def pause_playback(ctx: Context) -> dict:
         
         msg = "Playback paused"
         logger.info(msg)
-        ctx.info(msg)
+        await ctx.info(msg)
         return {"status": "paused", "file": state.playing}
         
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Pause error: {error_msg}")
-        ctx.error(error_msg)
+        await ctx.error(error_msg)
         raise
 
 @mcp.tool()
@@ -925,57 +1252,205 @@ async def resume_playback(ctx: Context) -> dict:
         
         msg = f"Resumed playback: {state.playing}"
         logger.info(msg)
-        ctx.info(msg)
+        await ctx.info(msg)
         return {"status": "resumed", "file": state.playing}
         
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Resume error: {error_msg}")
-        ctx.error(error_msg)
+        await ctx.error(error_msg)
         raise
 
+class _AudioFile(NamedTuple):
+    """Path components of a library file, split once when the library is scanned"""
+    name: str
+    stem: str
+    extension: str
+    folder: str
+    absolute_path: str
+
+def _split_audio_path(filepath: str) -> _AudioFile:
+    """Split a relative audio file path into its name, stem, lowercase extension and folder"""
+    folder, name = os.path.split(filepath)
+    stem, extension = os.path.splitext(name)
+    return _AudioFile(name, stem, extension.lower(), folder or "root",
+                      os.path.join(_AUDIO_DIR_STR, filepath))
+
+# Scanned library, reused until the watcher reports a change or a scanned directory's mtime changes
+_files_cache = {"mtime": None, "files": None, "info": {}, "checked": 0.0}
+# Held while checking or rescanning, so concurrent callers share one scan
+_files_cache_lock = threading.Lock()
+
+# Seconds a directory mtime check stays valid without inotify, so bursts of tool calls
+# (status polls, next/previous) don't re-stat the whole tree every time
+_FRESHNESS_TTL = 2.0
+
+def _audio_files_known_fresh() -> bool:
+    """Whether _get_audio_files() can return its cached list without touching the disk"""
+    if _files_cache["files"] is None:
+        return False
+    if _watcher.active:
+        return not _watcher.dirty
+    return time.monotonic() - _files_cache["checked"] < _FRESHNESS_TTL
+
 def _get_audio_files() -> list:
-    """Helper function to get available audio files recursively from all subfolders"""
-    audio_files = []
+    """Helper function to get available audio files, rescanning only when the library changed
+    
+    The same list object is returned until a rescan, so callers must not modify it.
+    """
+    if _audio_files_known_fresh():
+        return _files_cache["files"]
     
-    def scan_directory(directory: Path, base_path: Path):
-        """Recursively scan directory for audio files"""
+    with _files_cache_lock:
+        # Another caller may have checked or rescanned while this one waited
+        if _audio_files_known_fresh():
+            return _files_cache["files"]
+        if (_files_cache["files"] is not None and not _watcher.active
+                and not _directory_mtimes_changed(_files_cache["mtime"])):
+            _files_cache["checked"] = time.monotonic()
+            return _files_cache["files"]
+        
+        # Cleared before scanning so events that arrive mid-scan force another rescan
+        _watcher.dirty = False
+        _files_cache["checked"] = time.monotonic()
+        dir_mtimes = {}
+        info = _scan_audio_files(dir_mtimes)
+        files = list(info)
+        _files_cache["mtime"] = dir_mtimes
+        _files_cache["info"] = info
+        _files_cache["files"] = files
+        # Changes between listing a directory and watching it produce no event, but they do
+        # show up in its mtime
+        if _watcher.watch(dir_mtimes) and _directory_mtimes_changed(dir_mtimes):
+            _watcher.dirty = True
+    return files
+
+def _expire_audio_files():
+    """Make the next _get_audio_files() call check the directories again, ignoring the TTL"""
+    _files_cache["checked"] = 0.0
+
+def _get_audio_file(filepath: str) -> _AudioFile:
+    """Get the path components of a file returned by _get_audio_files()"""
+    info = _files_cache["info"].get(filepath)
+    return info if info is not None else _split_audio_path(filepath)
+
+# Top-level folders are scanned concurrently so directory reads overlap on slow or cold storage
+_scan_executor = ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) * 2),
+                                    thread_name_prefix="library-scan")
+
+def _scan_tree(directory: str, prefix: str, ancestors: tuple = ()) -> tuple[dict, dict]:
+    """Walk one directory tree, returning its audio files and directory mtimes in scan order
+    
+    ancestors holds the (st_dev, st_ino) identities of the directories above this tree,
+    so symlinks back into them are skipped.
+    """
+    audio_files = {}
+    dir_mtimes = {}
+    # Directories being listed, innermost last, as (open scandir iterator, path, relative prefix,
+    # identity). An explicit stack keeps deep trees clear of the recursion limit and still visits
+    # entries in the same depth-first order as a recursive walk.
+    stack = []
+    
+    def open_directory(directory: str, prefix: str):
         try:
-            for item in directory.iterdir():
-                if item.is_file() and item.suffix.lower() in SUPPORTED_FORMATS:
-                    # Store relative path from base audio directory for better organization
-                    relative_path = item.relative_to(base_path)
-                    audio_files.append(str(relative_path))
-                elif item.is_dir():
-                    # Recursively scan subdirectories
-                    scan_directory(item, base_path)
+            dir_stat = os.stat(directory)
+            identity = (dir_stat.st_dev, dir_stat.st_ino)
+            # A symlink back to one of its own ancestors would otherwise be walked forever
+            if identity in ancestors or any(identity == open_identity for _, _, _, open_identity in stack):
+                logger.warning(f"Skipping directory symlink loop: {directory}")
+                return
+            # Record before listing so changes made during the scan invalidate it
+            dir_mtimes[directory] = dir_stat.st_mtime_ns
+            stack.append((os.scandir(directory), directory, prefix, identity))
         except PermissionError:
             # Skip directories we don't have permission to read
             logger.warning(f"Permission denied accessing directory: {directory}")
         except Exception as e:
             logger.warning(f"Error scanning directory {directory}: {e}")
     
+    open_directory(directory, prefix)
+    # Top-level folders handed to the pool, as (number of files found before them, future)
+    subtrees = []
+    at_top = bool(stack) and not ancestors
+    while stack:
+        entries, directory, prefix, _ = stack[-1]
+        try:
+            # DirEntry carries the file type from the directory read, so no stat() per entry
+            entry = next(entries, None)
+            if entry is None:
+                entries.close()
+                stack.pop()
+            elif entry.is_file() and entry.name.lower().endswith(_AUDIO_EXTS):
+                # Store relative path from base audio directory for better organization
+                stem, extension = os.path.splitext(entry.name)
+                audio_files[os.path.join(prefix, entry.name)] = _AudioFile(
+                    entry.name, stem, extension.lower(), prefix or "root", entry.path)
+            elif entry.is_dir():
+                if at_top and len(stack) == 1:
+                    subtrees.append((len(audio_files), _scan_executor.submit(
+                        _scan_tree, entry.path, os.path.join(prefix, entry.name), (stack[0][3],))))
+                else:
+                    # Descend into subdirectories before continuing with this one
+                    open_directory(entry.path, os.path.join(prefix, entry.name))
+        except Exception as e:
+            # Give up on the rest of this directory, like the recursive walk did
+            logger.warning(f"Error scanning directory {directory}: {e}")
+            entries.close()
+            stack.pop()
+    
+    if subtrees:
+        # Splice each subtree's results in where a sequential walk would have found them
+        top_files = list(audio_files.items())
+        audio_files = {}
+        start = 0
+        for position, future in subtrees:
+            audio_files.update(top_files[start:position])
+            start = position
+            subtree_files, subtree_mtimes = future.result()
+            audio_files.update(subtree_files)
+            dir_mtimes.update(subtree_mtimes)
+        audio_files.update(top_files[start:])
+    return audio_files, dir_mtimes
+
+def _scan_audio_files(dir_mtimes: dict | None = None) -> dict:
+    """Scan the audio directory recursively for audio files in all subfolders
+    
+    Returns a dict mapping each relative path to its _AudioFile, in scan order.
+    If dir_mtimes is given, it is filled with the st_mtime_ns of every scanned directory
+    so callers can tell later whether a rescan is needed.
+    """
     try:
-        scan_directory(AUDIO_DIR, AUDIO_DIR)
-        logger.info(f"Found {len(audio_files)} audio files across all subdirectories")
+        audio_files, scanned_mtimes = _scan_tree(_AUDIO_DIR_STR, "")
     except Exception as e:
         logger.error(f"Error scanning audio directory: {e}")
-    
+        return {}
+    if dir_mtimes is not None:
+        dir_mtimes.update(scanned_mtimes)
+    logger.debug("Found %d audio files across all subdirectories", len(audio_files))
     return audio_files
 
 def _update_playlist():
     """Update the playlist with all available audio files"""
-    state.playlist = _get_audio_files()
-    if state.playing and state.playing in state.playlist:
-        state.current_index = state.playlist.index(state.playing)
+    files = _get_audio_files()
+    if files is not state.playlist:
+        # Only rebuilt when the library was rescanned; saves a linear index() on every update
+        state.playlist = files
+        state.playlist_positions = {filepath: i for i, filepath in enumerate(files)}
+    state.current_index = state.playlist_positions.get(state.playing, -1) if state.playing else -1
+
+async def _refresh_playlist():
+    """Update the playlist, only moving to a worker thread when the library has to be checked"""
+    if _audio_files_known_fresh() and _files_cache["files"] is state.playlist:
+        # Just a dict lookup for the current index, cheaper than the thread hop
+        _update_playlist()
     else:
-        state.current_index = -1
+        await asyncio.to_thread(_update_playlist)
 
 @mcp.tool()
 async def next_song(ctx: Context) -> dict:
     """Play the next song in the playlist"""
     try:
-        _update_playlist()
+        await _refresh_playlist()
         
         if not state.playlist:
             msg = "No audio files available"
@@ -996,7 +1471,7 @@ async def next_song(ctx: Context) -> dict:
         
         msg = f"Playing next song: {next_filename}"
         logger.info(msg)
-        ctx.info(msg)
+        await ctx.info(msg)
         return {
             "status": "next_song",
             "file": next_filename,
@@ -1006,14 +1481,14 @@ async def next_song(ctx: Context) -> dict:
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Next song error: {error_msg}")
-        ctx.error(error_msg)
+        await ctx.error(error_msg)
         raise
 
 @mcp.tool()
 async def previous_song(ctx: Context) -> dict:
     """Play the previous song in the playlist"""
     try:
-        _update_playlist()
+        await _refresh_playlist()
         
         if not state.playlist:
             msg = "No audio files available"
@@ -1034,7 +1509,7 @@ async def previous_song(ctx: Context) -> dict:
         
         msg = f"Playing previous song: {prev_filename}"
         logger.info(msg)
-        ctx.info(msg)
+        await ctx.info(msg)
         return {
             "status": "previous_song",
             "file": prev_filename,
@@ -1044,7 +1519,7 @@ async def previous_song(ctx: Context) -> dict:
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Previous song error: {error_msg}")
-        ctx.error(error_msg)
+        await ctx.error(error_msg)
         raise
 
 @mcp.tool()
@@ -1066,7 +1541,7 @@ async def skip_forward(ctx: Context, seconds: int = 30) -> dict:
         new_time = current_time + (seconds * 1000)  # Convert seconds to milliseconds
         
         # Get the total length to avoid seeking beyond the end
-        length = state.media_player.get_length()
+        length = state.track_length_ms()
         if length > 0 and new_time > length:
             new_time = length - 1000  # Stay 1 second before the end
         
@@ -1074,7 +1549,7 @@ async def skip_forward(ctx: Context, seconds: int = 30) -> dict:
         
         msg = f"Skipped forward {seconds} seconds"
         logger.info(msg)
-        ctx.info(msg)
+        await ctx.info(msg)
         
         return {
             "status": "skip_forward",
@@ -1086,7 +1561,7 @@ async def skip_forward(ctx: Context, seconds: int = 30) -> dict:
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Skip forward error: {error_msg}")
-        ctx.error(error_msg)
+        await ctx.error(error_msg)
         raise
 
 @mcp.tool()
@@ -1115,7 +1590,7 @@ async def skip_backward(ctx: Context, seconds: int = 10) -> dict:
         
         msg = f"Skipped backward {seconds} seconds"
         logger.info(msg)
-        ctx.info(msg)
+        await ctx.info(msg)
         
         return {
             "status": "skip_backward",
@@ -1127,14 +1602,28 @@ async def skip_backward(ctx: Context, seconds: int = 10) -> dict:
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Skip backward error: {error_msg}")
-        ctx.error(error_msg)
+        await ctx.error(error_msg)
         raise
 
 @mcp.tool()
 async def get_playback_status(ctx: Context) -> dict:
     """Get current playback status"""
     try:
-        _update_playlist()
+        if state.playing is None and _files_cache["files"] is not None:
+            # Nothing has been played (or it was stopped), so there is no position to look up
+            # and status polls can skip the library check; the size comes from the last scan.
+            # Before the first scan this falls through so the size isn't reported as 0
+            return {
+                "status": "paused" if state.paused else "stopped",
+                "current_file": None,
+                "paused": state.paused,
+                "volume": state.volume,
+                "playlist_size": len(_files_cache["files"] or state.playlist),
+                "current_position": "0/0",
+                "time_position": "0s / 0s"
+            }
+        
+        await _refresh_playlist()
         
         is_playing = False
         current_time = 0
@@ -1143,7 +1632,7 @@ async def get_playback_status(ctx: Context) -> dict:
         if state.media_player is not None:
             is_playing = state.media_player.is_playing()
             current_time = state.media_player.get_time() // 1000  # Convert to seconds
-            total_time = state.media_player.get_length() // 1000  # Convert to seconds
+            total_time = state.track_length_ms() // 1000  # Convert to seconds
         
         return {
             "status": "playing" if is_playing and not state.paused else "paused" if state.paused else "stopped",
@@ -1158,7 +1647,7 @@ async def get_playback_status(ctx: Context) -> dict:
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Status error: {error_msg}")
-        ctx.error(error_msg)
+        await ctx.error(error_msg)
         raise
 
 @mcp.tool()
@@ -1176,7 +1665,7 @@ async def diagnose_audio_system(ctx: Context) -> dict:
         
         # Check if VLC is available
         try:
-            diagnosis["vlc_version"] = vlc.libvlc_get_version().decode('utf-8')
+            diagnosis["vlc_version"] = _load_vlc().libvlc_get_version().decode('utf-8')
             diagnosis["vlc_available"] = True
             logger.info(f"VLC version: {diagnosis['vlc_version']}")
         except Exception as e:
@@ -1207,13 +1696,13 @@ async def diagnose_audio_system(ctx: Context) -> dict:
                 diagnosis["error_details"].append(f"Failed to initialize VLC: {e}")
                 logger.error(f"Failed to initialize VLC: {e}")
         
-        ctx.info("Audio system diagnosis completed")
+        await ctx.info("Audio system diagnosis completed")
         return diagnosis
         
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Diagnosis error: {error_msg}")
-        ctx.error(error_msg)
+        await ctx.error(error_msg)
         return {"error": error_msg}
 
 @mcp.tool()
@@ -1230,7 +1719,7 @@ async def set_volume(volume: int, ctx: Context) -> dict:
         
         msg = f"Volume set to {volume}/10"
         logger.info(msg)
-        ctx.info(msg)
+        await ctx.info(msg)
         
         return {
             "status": "volume_changed",
@@ -1241,7 +1730,7 @@ async def set_volume(volume: int, ctx: Context) -> dict:
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Volume error: {error_msg}")
-        ctx.error(error_msg)
+        await ctx.error(error_msg)
         raise
 
 @mcp.tool()
@@ -1262,7 +1751,7 @@ async def seek_to_position(position_seconds: int, ctx: Context) -> dict:
         position_ms = position_seconds * 1000
         
         # Get the total length to validate the position
-        length = state.media_player.get_length()
+        length = state.track_length_ms()
         if length > 0 and position_ms > length:
             position_ms = length - 1000  # Stay 1 second before the end
         
@@ -1273,7 +1762,7 @@ async def seek_to_position(position_seconds: int, ctx: Context) -> dict:
         
         msg = f"Seeked to position: {position_seconds} seconds"
         logger.info(msg)
-        ctx.info(msg)
+        await ctx.info(msg)
         
         return {
             "status": "seeked",
@@ -1284,7 +1773,7 @@ async def seek_to_position(position_seconds: int, ctx: Context) -> dict:
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Seek error: {error_msg}")
-        ctx.error(error_msg)
+        await ctx.error(error_msg)
         raise
 
 @mcp.tool()
@@ -1293,7 +1782,7 @@ async def list_genres(ctx: Context) -> dict:
     logger.info("Listing all genres in music collection")
     
     try:
-        genre_counts = _get_all_genres()
+        genre_counts = await asyncio.to_thread(_get_all_genres)
         
         # Sort genres by count (most common first)
         sorted_genres = sorted(genre_counts.items(), key=lambda x: x[1], reverse=True)
@@ -1301,7 +1790,7 @@ async def list_genres(ctx: Context) -> dict:
         total_files = sum(genre_counts.values())
         unique_genres = len(genre_counts)
         
-        ctx.info(f"Found {unique_genres} unique genres across {total_files} files")
+        await ctx.info(f"Found {unique_genres} unique genres across {total_files} files")
         
         return {
             "status": "success",
@@ -1316,7 +1805,7 @@ async def list_genres(ctx: Context) -> dict:
     except Exception as e:
         error_msg = str(e)
         logger.error(f"List genres error: {error_msg}")
-        ctx.error(error_msg)
+        await ctx.error(error_msg)
         raise
 
 @mcp.tool()
@@ -1325,9 +1814,9 @@ async def search_by_genre(genre: str, ctx: Context, limit: int = 20) -> dict:
     logger.info(f"Searching for songs in genre: '{genre}'")
     
     try:
-        matching_files = _search_by_genre(genre, limit)
+        matching_files = await asyncio.to_thread(_search_by_genre, genre, limit)
         
-        ctx.info(f"Found {len(matching_files)} songs in genre '{genre}'")
+        await ctx.info(f"Found {len(matching_files)} songs in genre '{genre}'")
         
         return {
             "status": "success",
@@ -1339,9 +1828,15 @@ async def search_by_genre(genre: str, ctx: Context, limit: int = 20) -> dict:
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Search by genre error: {error_msg}")
-        ctx.error(error_msg)
+        await ctx.error(error_msg)
         raise
 
+def _partial_ratio_hits(query: str, texts: list, cutoff: int = 80) -> set:
+    """Get the indices of texts that partially match the query, case-insensitively, in one RapidFuzz call"""
+    return {index for _, _, index in process.extract_iter(query, texts, scorer=fuzz.partial_ratio,
+                                                          processor=str.lower, score_cutoff=cutoff)
+            if texts[index]}
+
 @mcp.tool()
 async def play_random_song_by_artist(artist: str, ctx: Context) -> dict:
     """Play a random song by the specified artist"""
@@ -1360,16 +1855,16 @@ async def play_random_song_by_artist(artist: str, ctx: Context) -> dict:
             }
         
         # Filter results to prioritize artist matches over filename matches
+        matches = search_result["matches"]
+        artist_hits = _partial_ratio_hits(artist, [match.get("artist") or "" for match in matches])
+        display_hits = _partial_ratio_hits(artist, [match.get("display_info") or "" for match in matches])
+        
         artist_matches = []
         other_matches = []
         
-        for match in search_result["matches"]:
+        for index, match in enumerate(matches):
             # Check if the match is likely an artist match
-            if (match.get("artist") and 
-                fuzz.partial_ratio(artist.lower(), match["artist"].lower()) >= 80):
-                artist_matches.append(match)
-            elif (match.get("display_info") and 
-                  fuzz.partial_ratio(artist.lower(), match["display_info"].lower()) >= 80):
+            if index in artist_hits or index in display_hits:
                 artist_matches.append(match)
             elif match.get("match_type") == "metadata":
                 artist_matches.append(match)
@@ -1392,7 +1887,7 @@ async def play_random_song_by_artist(artist: str, ctx: Context) -> dict:
         play_result = await play_audio(random_song["file"], ctx)
         
         # Add artist info to the result
-        if play_result.get("status") == "success":
+        if play_result.get("status") == "playing":
             play_result["artist_searched"] = artist
             play_result["selected_from"] = f"{len(available_songs)} songs by '{artist}'"
             play_result["match_score"] = random_song.get("score", 0)
@@ -1407,7 +1902,7 @@ async def play_random_song_by_artist(artist: str, ctx: Context) -> dict:
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Play random song by artist error: {error_msg}")
-        ctx.error(error_msg)
+        await ctx.error(error_msg)
         raise
 
 @mcp.tool()
@@ -1416,35 +1911,51 @@ async def play_random_from_genre(genre: str, ctx: Context) -> dict:
     logger.info(f"Playing random song from genre: '{genre}'")
     
     try:
-        import random
-        
-        matching_files = _search_by_genre(genre, limit=100)  # Get more options for randomness
+        # Pick a random song
+        random_song, match_count = await asyncio.to_thread(_pick_random_by_genre, genre)
         
-        if not matching_files:
+        if random_song is None:
             return {
                 "status": "no_matches",
                 "message": f"No songs found in genre '{genre}'"
             }
         
-        # Pick a random song
-        random_song = random.choice(matching_files)
-        
         # Play the selected song
         play_result = await play_audio(random_song["file"], ctx)
         
         # Add genre info to the result
-        if play_result.get("status") == "success":
+        if play_result.get("status") == "playing":
             play_result["genre"] = random_song["genre"]
-            play_result["selected_from"] = f"{len(matching_files)} songs in genre '{genre}'"
+            play_result["selected_from"] = f"{match_count} songs in genre '{genre}'"
         
         return play_result
         
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Play random from genre error: {error_msg}")
-        ctx.error(error_msg)
+        await ctx.error(error_msg)
         raise
 
-if __name__ == "__main__":
+def _warm_vlc():
+    """Initialize VLC ahead of the first playback request"""
+    try:
+        state.init_vlc()
+    except Exception as e:
+        logger.warning(f"VLC pre-initialization failed, will retry on first playback: {e}")
+
+def main():
+    """Run the MCP server over stdio, or set MCP_TRANSPORT=streamable-http to serve concurrent clients"""
     logger.info(f"Starting audio player MCP server with directory: {AUDIO_DIR}")
-    mcp.run()
\ No newline at end of file
+    # Bring up libVLC in the background while the client handshake runs, so neither
+    # startup nor the first play request waits for it
+    threading.Thread(target=_warm_vlc, name="vlc-warmup", daemon=True).start()
+    
+    transport = os.environ.get('MCP_TRANSPORT', 'stdio')
+    if transport != 'stdio':
+        mcp.settings.host = "127.0.0.1"
+        mcp.settings.port = int(os.environ.get('MCP_PORT', '8765'))
+        logger.info(f"Serving MCP over {transport} on {mcp.settings.host}:{mcp.settings.port}")
+    mcp.run(transport=transport)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
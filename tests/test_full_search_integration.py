@@ -12,14 +12,14 @@ from pathlib import Path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 try:
-    from audio_player_mcp.player import search_songs
+    from audio_player_mcp.player import search_songs, _get_audio_files, _get_search_data
     from mcp.server.fastmcp import Context
     
     class MockContext:
-        def info(self, message):
+        async def info(self, message):
             print(f"ℹ️  {message}")
         
-        def error(self, message):
+        async def error(self, message):
             print(f"❌ {message}")
     
     async def test_full_search():
@@ -41,12 +41,17 @@ try:
             "Circles"  # Post Malone hit
         ]
         
-        for query in test_queries:
+        # Scan the library and build the search index once up front, so the concurrent
+        # queries below only score the cached index
+        await asyncio.to_thread(lambda: _get_search_data(_get_audio_files()))
+        
+        # The queries are independent, so run them concurrently and report them in order
+        results = await asyncio.gather(*[search_songs(query, ctx, limit=3) for query in test_queries])
+        
+        for query, result in zip(test_queries, results):
             print(f"\n🔎 Testing full search for: '{query}'")
             print("-" * 30)
             
-            result = await search_songs(query, ctx, limit=3)
-            
             if result["status"] == "success":
                 print(f"✅ Found {len(result['matches'])} matches")
                 for i, match in enumerate(result["matches"], 1):
@@ -63,6 +68,8 @@ try:
                 print(f"❌ Search failed: {result.get('message', 'Unknown error')}")
     
     if __name__ == "__main__":
+        # Buffer the report instead of flushing every line to the console
+        sys.stdout.reconfigure(line_buffering=False)
         asyncio.run(test_full_search())
 
 except ImportError as e:
@@ -11,9 +11,10 @@ from pathlib import Path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 try:
-    from fuzzywuzzy import process
+    from rapidfuzz import process, utils
     from audio_player_mcp.player import (_get_audio_files, AUDIO_DIR, 
-                                        _normalize_music_terms, _enhanced_music_search)
+                                        _normalize_music_terms, _enhanced_music_search,
+                                        _FILENAME_SEPARATORS)
     
     print("🔍 Fuzzy Search Test")
     print("=" * 40)
@@ -71,22 +72,19 @@ try:
         "original"  # common in song titles
     ]
     
+    # Prepare file names for search once; they don't depend on the query
+    file_names_for_search = [os.path.splitext(os.path.basename(file))[0].translate(_FILENAME_SEPARATORS)
+                             for file in files]
+    
     print("\n🔎 Testing fuzzy search:")
     for query in test_queries:
         print(f"\n🔍 Query: '{query}'")
         
-        # Prepare file names for search
-        file_names_for_search = []
-        for file in files:
-            name_without_ext = Path(file).stem
-            clean_name = name_without_ext.replace('_', ' ').replace('-', ' ').replace('.', ' ')
-            file_names_for_search.append(clean_name)
-        
         # Find matches
-        matches = process.extract(query, file_names_for_search, limit=3)
+        matches = process.extract(query, file_names_for_search, limit=3,
+                                  processor=utils.default_process)
         
-        for i, (match, score) in enumerate(matches, 1):
-            idx = file_names_for_search.index(match)
+        for i, (match, score, idx) in enumerate(matches, 1):
             original_file = files[idx]
             print(f"  {i}. {original_file} (score: {score})")
             
@@ -121,7 +119,7 @@ try:
 except ImportError as e:
     print(f"❌ Import error: {e}")
     print("💡 Make sure to install dependencies:")
-    print("   pip install fuzzywuzzy python-Levenshtein")
+    print("   pip install rapidfuzz")
 except Exception as e:
     print(f"❌ Error: {e}")
     import traceback
@@ -5,14 +5,14 @@ Test script for genre search functionality
 
 import sys
 import os
-from pathlib import Path
 
 # Add the src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 try:
     from audio_player_mcp.player import (_get_audio_files, _extract_genre_from_file, 
-                                        _get_all_genres, _search_by_genre, AUDIO_DIR)
+                                        _get_all_genres, _search_by_genre, _get_audio_file)
+    import heapq
     import time
 
     def test_genre_functionality():
@@ -33,10 +33,10 @@ try:
         # Test genre extraction on first 10 files
         print(f"\n🔍 Testing genre extraction on first 10 files:")
         for i, file_path in enumerate(files[:10], 1):
-            # Convert relative path to absolute path for genre extraction
-            absolute_path = AUDIO_DIR / file_path
-            genre = _extract_genre_from_file(str(absolute_path))
-            filename = Path(file_path).name
+            # The scan already recorded each file's absolute path and name
+            audio_file = _get_audio_file(file_path)
+            genre = _extract_genre_from_file(audio_file.absolute_path)
+            filename = audio_file.name
             print(f"  {i}. {filename[:50]}{'...' if len(filename) > 50 else ''}")
             print(f"     Genre: {genre}")
         
@@ -51,10 +51,12 @@ try:
         print(f"✅ Genre analysis completed in {end_time - start_time:.2f} seconds")
         print(f"🎼 Found {len(genre_counts)} unique genres")
         
-        # Show top 10 genres
-        sorted_genres = sorted(genre_counts.items(), key=lambda x: x[1], reverse=True)
+        # Show top 10 genres; nlargest keeps ties in order like the stable sort it replaces
+        top_genres = heapq.nlargest(10, genre_counts.items(), key=lambda x: x[1])
+        # Lowercased once for the membership checks below
+        genre_names_lower = [found_genre.lower() for found_genre in genre_counts]
         print(f"\n🏆 Top 10 genres by count:")
-        for i, (genre, count) in enumerate(sorted_genres[:10], 1):
+        for i, (genre, count) in enumerate(top_genres, 1):
             print(f"  {i}. {genre}: {count} songs")
         
         # Test searching by popular genres
@@ -62,7 +64,8 @@ try:
         
         print(f"\n🎯 Testing search for popular genres:")
         for genre in popular_genres_to_test:
-            if any(genre.lower() in found_genre.lower() for found_genre, _ in sorted_genres):
+            genre_lower = genre.lower()
+            if any(genre_lower in found_genre for found_genre in genre_names_lower):
                 print(f"\n🔎 Searching for genre '{genre}':")
                 genre_results = _search_by_genre(genre, limit=3)
                 if genre_results:
@@ -76,8 +79,8 @@ try:
                 print(f"  ⏭️  Genre '{genre}' not found in music library")
         
         # Test searching by most common genre
-        if sorted_genres:
-            top_genre = sorted_genres[0][0]
+        if top_genres:
+            top_genre = top_genres[0][0]
             print(f"\n🔎 Testing search for most common genre '{top_genre}':")
             
             genre_results = _search_by_genre(top_genre, limit=5)
@@ -7,6 +7,7 @@ This simulates the MCP server environment more closely
 import sys
 import os
 import time
+import threading
 from pathlib import Path
 
 # Add the src directory to Python path
@@ -22,15 +23,15 @@ def test_mcp_vlc_environment():
     print("Looking for popular songs to test with...")
     
     # Try to find any popular song files (more flexible approach)
-    from audio_player_mcp.player import _get_audio_files, AUDIO_DIR
+    from audio_player_mcp.player import _get_audio_files, _get_audio_file
     
     files = _get_audio_files()
     if not files:
         print("❌ No audio files found in music directory")
         return False
     
-    # Convert relative path to absolute for the first available file
-    test_file = str(AUDIO_DIR / files[0])
+    # Absolute path of the first available file, as recorded by the scan
+    test_file = _get_audio_file(files[0]).absolute_path
     print(f"📀 Using test file: {Path(test_file).name}")
     
     if not Path(test_file).exists():
@@ -64,13 +65,20 @@ def test_mcp_vlc_environment():
         state.media_player.audio_set_volume(30)  # 30%
         print("🔊 Volume set to 30%")
         
+        # Get notified when playback starts or fails instead of sleeping a fixed second
+        import vlc
+        started = threading.Event()
+        events = state.media_player.event_manager()
+        events.event_attach(vlc.EventType.MediaPlayerPlaying, lambda event: started.set())
+        events.event_attach(vlc.EventType.MediaPlayerEncounteredError, lambda event: started.set())
+        
         # Test playback
         print("▶️ Starting playback...")
         play_result = state.media_player.play()
         print(f"Play result: {play_result}")
         
         # Wait and check status
-        time.sleep(1)
+        started.wait(timeout=2)
         
         is_playing = state.media_player.is_playing()
         player_state = state.media_player.get_state()
@@ -108,10 +116,10 @@ def test_audio_outputs():
     print("\n🔊 Testing audio outputs...")
     
     try:
-        import vlc
-        
-        # Create a simple VLC instance
-        instance = vlc.Instance()
+        # Use the player's own instance; the playback test below reuses it instead of
+        # starting a second libVLC
+        state.init_vlc()
+        instance = state.vlc_instance
         
         # Try to enumerate audio outputs
         try:
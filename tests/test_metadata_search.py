@@ -5,7 +5,6 @@ Test script for enhanced metadata search functionality
 
 import sys
 import os
-from pathlib import Path
 
 # Add the src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -13,7 +12,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 try:
     from audio_player_mcp.player import (_get_audio_files, _extract_title_and_artist, 
                                         _enhanced_metadata_search, _create_search_data_for_file,
-                                        AUDIO_DIR)
+                                        _get_audio_file)
     import time
 
     def test_metadata_search():
@@ -31,9 +30,10 @@ try:
         # Test metadata extraction on first 5 files
         print(f"\n🔍 Testing metadata extraction on first 5 files:")
         for i, file_path in enumerate(files[:5], 1):
-            absolute_path = AUDIO_DIR / file_path
-            title, artist = _extract_title_and_artist(str(absolute_path))
-            filename = Path(file_path).name
+            # The scan already recorded each file's absolute path and name
+            audio_file = _get_audio_file(file_path)
+            title, artist = _extract_title_and_artist(audio_file.absolute_path)
+            filename = audio_file.name
             print(f"  {i}. {filename[:40]}{'...' if len(filename) > 40 else ''}")
             print(f"     Title: {title if title else 'N/A'}")
             print(f"     Artist: {artist if artist else 'N/A'}")
@@ -68,12 +68,14 @@ try:
         print(f"🔍 Testing enhanced metadata search with various queries:")
         print("-" * 50)
         
+        # Test with a subset of files for reasonable performance. Sliced once: the search
+        # data is cached per list object, so a fresh slice per query would rebuild it every time
+        test_files = files[:min(100, len(files))]
+        
         for query in test_queries:
             print(f"\n🔎 Searching for: '{query}'")
             
             start_time = time.time()
-            # Test with a subset of files for reasonable performance
-            test_files = files[:min(100, len(files))]
             results = _enhanced_metadata_search(test_files, query, limit=3)
             end_time = time.time()
             
@@ -100,7 +102,7 @@ try:
 except ImportError as e:
     print(f"❌ Import error: {e}")
     print("💡 Make sure to install dependencies:")
-    print("   pip install mutagen fuzzywuzzy")
+    print("   pip install mutagen rapidfuzz")
 except Exception as e:
     print(f"❌ Error: {e}")
     import traceback
@@ -57,6 +57,7 @@ try:
                 print(f"❌ {artist}: No songs found")
         
         print()
+        sys.stdout.flush()  # One write per section
         
         # Popular song searches
         print("🎵 Testing Popular Song Title Searches")
@@ -87,6 +88,7 @@ try:
                 print(f"❌ '{song}': No matches found")
         
         print()
+        sys.stdout.flush()  # One write per section
         
         # Popular genre searches
         print("🎼 Testing Popular Genre Searches")
@@ -96,14 +98,18 @@ try:
         all_genres = _get_all_genres()
         popular_genres = ["Pop", "Hip Hop", "Rock", "Electronic", "Dance", "R&B", "Country", "Alternative", "Rap"]
         
+        # Lowercase every genre once instead of once per popular genre
+        all_genres_lower = [(g, g.lower(), count) for g, count in all_genres.items()]
+        
         genre_results = {}
         for genre in popular_genres:
             # Find matching genres (case insensitive)
-            matching_genres = [g for g in all_genres.keys() if genre.lower() in g.lower()]
+            genre_lower = genre.lower()
+            matching_genres = [(g, count) for g, g_lower, count in all_genres_lower if genre_lower in g_lower]
             
             if matching_genres:
                 # Use the most common matching genre
-                best_genre = max(matching_genres, key=lambda g: all_genres[g])
+                best_genre = max(matching_genres, key=lambda match: match[1])[0]
                 results = _search_by_genre(best_genre, limit=3)
                 genre_results[genre] = len(results)
                 print(f"✅ {genre} (as '{best_genre}'): Found {len(results)} songs")
@@ -114,6 +120,7 @@ try:
                 print(f"❌ {genre}: No matching genre found")
         
         print()
+        sys.stdout.flush()  # One write per section
         
         # Summary statistics
         print("📊 Search Results Summary")
@@ -147,12 +154,14 @@ try:
         print("\n✅ Popular music search test completed!")
 
     if __name__ == "__main__":
+        # Buffer the report and flush it per section instead of flushing every line to the console
+        sys.stdout.reconfigure(line_buffering=False)
         test_popular_music_scenarios()
 
 except ImportError as e:
     print(f"❌ Import error: {e}")
     print("💡 Make sure to install dependencies:")
-    print("   pip install mutagen fuzzywuzzy")
+    print("   pip install mutagen rapidfuzz")
 except Exception as e:
     print(f"❌ Error: {e}")
     import traceback
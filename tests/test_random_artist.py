@@ -13,10 +13,10 @@ import asyncio
 
 # Mock the Context class for testing
 class MockContext:
-    def info(self, message):
+    async def info(self, message):
         print(f"INFO: {message}")
     
-    def error(self, message):
+    async def error(self, message):
         print(f"ERROR: {message}")
 
 async def test_random_artist_function():
@@ -25,7 +25,7 @@ async def test_random_artist_function():
     print(f"Audio directory: {AUDIO_DIR}")
     
     # Import the function after the path is set
-    from audio_player_mcp.player import play_random_song_by_artist, search_songs
+    from audio_player_mcp.player import play_random_song_by_artist
     
     # Test popular artists
     popular_artists = [
@@ -42,30 +42,23 @@ async def test_random_artist_function():
         print(f"\n--- Testing artist: {artist} ---")
         
         try:
-            # First check if we have any songs by this artist
-            search_result = await search_songs(artist, ctx, limit=10)
+            # play_random_song_by_artist runs the search itself and reports no_matches when
+            # there is nothing by this artist, so no separate search is needed first
+            result = await play_random_song_by_artist(artist, ctx)
             
-            if search_result["status"] == "success" and search_result["matches"]:
-                print(f"Found {len(search_result['matches'])} potential matches for {artist}")
-                
-                # Now test the random function
-                result = await play_random_song_by_artist(artist, ctx)
-                
-                if result["status"] == "success":
-                    print(f"✅ Successfully would play random {artist} song:")
-                    print(f"   File: {result.get('filename', 'N/A')}")
-                    print(f"   Selected from: {result.get('selected_from', 'N/A')}")
-                    print(f"   Match score: {result.get('match_score', 'N/A')}")
-                    if result.get('artist_metadata'):
-                        print(f"   Artist metadata: {result['artist_metadata']}")
-                    if result.get('title_metadata'):
-                        print(f"   Title metadata: {result['title_metadata']}")
-                elif result["status"] == "no_matches":
-                    print(f"❌ No songs found for {artist}")
-                else:
-                    print(f"❓ Unexpected result: {result}")
+            if result["status"] == "playing":
+                print(f"✅ Successfully would play random {artist} song:")
+                print(f"   File: {result.get('file', 'N/A')}")
+                print(f"   Selected from: {result.get('selected_from', 'N/A')}")
+                print(f"   Match score: {result.get('match_score', 'N/A')}")
+                if result.get('artist_metadata'):
+                    print(f"   Artist metadata: {result['artist_metadata']}")
+                if result.get('title_metadata'):
+                    print(f"   Title metadata: {result['title_metadata']}")
+            elif result["status"] == "no_matches":
+                print(f"❌ No songs found for {artist}")
             else:
-                print(f"❌ No songs found for {artist} in search")
+                print(f"❓ Unexpected result: {result}")
                 
         except Exception as e:
             print(f"❌ Error testing {artist}: {e}")
@@ -6,6 +6,7 @@ Usage: python test_vlc_playback.py "path/to/audio/file"
 
 import sys
 import time
+import threading
 import vlc
 from pathlib import Path
 
@@ -38,12 +39,18 @@ def test_vlc_playback(file_path):
         # Set volume to 50%
         media_player.audio_set_volume(50)
         
+        # Get notified when playback starts or fails instead of sleeping a fixed second
+        started = threading.Event()
+        events = media_player.event_manager()
+        events.event_attach(vlc.EventType.MediaPlayerPlaying, lambda event: started.set())
+        events.event_attach(vlc.EventType.MediaPlayerEncounteredError, lambda event: started.set())
+        
         # Start playback
         print("▶️ Starting playback...")
         media_player.play()
         
         # Wait for playback to start
-        time.sleep(1)
+        started.wait(timeout=2)
         
         # Check if playing
         if media_player.is_playing():